@@ -9,7 +9,7 @@ from queue import Queue
 from time import time
 
 import psutil
-from PyQt5.QtCore import QObject, pyqtSignal, QFile, QIODevice, QTextStream
+from PyQt5.QtCore import QObject, pyqtSignal, QFile, QIODevice, QTextStream, QTimer, QMetaObject, Qt
 
 
 # WARNING !!!!! Don't ever remove this USED import !!!!!
@@ -28,13 +28,19 @@ def log(func):
 
     Logs are issued using is the logger named after the decorated function's enclosing module.
 
+    If that logger is not enabled for DEBUG level, the decorated function is called directly, so
+    params and return values are not turned into strings for nothing.
+
     :param func: The function to decorate
     :return: The decorated function
     """
     @wraps(func)
     def wrapped(*args, **kwargs):
-        function_name = func.__qualname__
         original_logger = logging.getLogger(func.__module__)
+        if not original_logger.isEnabledFor(logging.DEBUG):
+            return func(*args, **kwargs)
+
+        function_name = func.__qualname__
         logger = AlsLogAdapter(original_logger, {})
         logger.debug(f"{function_name}() called with : {str(args)} - {str(kwargs)}")
         start_time = time()
@@ -98,8 +104,17 @@ class SignalingQueue(Queue, QObject):
       - size_changed_signal
 
     and carries the new queue size
+
+    To avoid flooding Qt event loop when queue content changes at a high rate, signal is emitted at most once
+    every _MIN_EMIT_INTERVAL seconds, except when queue gets empty. Signal is never emitted twice in a row
+    for the same size.
+
+    Size changes that could not be emitted right away are flushed by a single shot timer, running in the thread
+    that created the queue. Queue must be created in a thread running a Qt event loop, i.e. the GUI thread.
     """
 
+    _MIN_EMIT_INTERVAL = 0.016
+
     size_changed_signal = pyqtSignal(int)
     """
     Qt signal stating that a new item has just been pushed to the queue.
@@ -112,28 +127,91 @@ class SignalingQueue(Queue, QObject):
     def __init__(self, maxsize=0):
         Queue.__init__(self, maxsize)
         QObject.__init__(self)
+        self._last_emitted_size = -1
+        self._last_emit_time = 0
+        self._flush_pending = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(int(SignalingQueue._MIN_EMIT_INTERVAL * 1000))
+        self._flush_timer.timeout.connect(self._flush_size_change)
 
     @log
     def get(self, block=True, timeout=None):
         item = super().get(block, timeout)
-        self.size_changed_signal.emit(self.qsize())
+        self._notify_size_change()
         return item
 
     @log
     def get_nowait(self):
         item = super().get_nowait()
-        self.size_changed_signal.emit(self.qsize())
+        self._notify_size_change()
         return item
 
     @log
     def put(self, item, block=True, timeout=None):
         super().put(item, block, timeout)
-        self.size_changed_signal.emit(self.qsize())
+        self._notify_size_change()
 
     @log
     def put_nowait(self, item):
         super().put_nowait(item)
-        self.size_changed_signal.emit(self.qsize())
+        self._notify_size_change()
+
+    @log
+    def clear(self):
+        """
+        Removes all items from the queue, holding the queue lock only once
+        """
+        with self.mutex:
+            self.queue.clear()
+            self.unfinished_tasks = 0
+            self.all_tasks_done.notify_all()
+            self.not_full.notify_all()
+        self._notify_size_change()
+
+    def _notify_size_change(self):
+        """
+        Emits size_changed_signal if size changed since last emit and emit rate allows it. Otherwise, schedules
+        a flush of the size change
+        """
+        emit_now = False
+        schedule_flush = False
+
+        # signal is emitted outside of the lock, as slots may query queue size
+        with self.mutex:
+            size = self._qsize()
+            now = time()
+
+            if size != self._last_emitted_size:
+                if size == 0 or now - self._last_emit_time >= SignalingQueue._MIN_EMIT_INTERVAL:
+                    self._last_emitted_size = size
+                    self._last_emit_time = now
+                    emit_now = True
+                elif not self._flush_pending:
+                    self._flush_pending = True
+                    schedule_flush = True
+
+        if emit_now:
+            self.size_changed_signal.emit(size)
+        elif schedule_flush:
+            # timer can only be started from its own thread
+            QMetaObject.invokeMethod(self._flush_timer, "start", Qt.QueuedConnection)
+
+    def _flush_size_change(self):
+        """
+        Emits size_changed_signal with current size, if it changed since last emit
+        """
+        with self.mutex:
+            self._flush_pending = False
+            size = self._qsize()
+
+            if size == self._last_emitted_size:
+                return
+
+            self._last_emitted_size = size
+            self._last_emit_time = time()
+
+        self.size_changed_signal.emit(size)
 
 
 class AlsLogAdapter(LoggerAdapter):
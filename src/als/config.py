@@ -48,6 +48,8 @@ _NIGHT_MODE = "night_mode"
 _SAVE_ON_STOP = "save_on_stop"
 _PROFILE = "profile"
 _PRESERVED_MEM = "preserved_mem"
+_DECODE_WORKERS = "decode_workers"
+_DECODE_BACKLOG_MAX = "decode_backlog_max"
 
 # keys used to describe logging level
 _LOG_LEVEL_DEBUG = "DEBUG"
@@ -87,11 +89,21 @@ _DEFAULTS = {
     _SAVE_ON_STOP:          0,
     _PROFILE:               0,
     _PRESERVED_MEM:         1,
+    _DECODE_WORKERS:        4,
+    _DECODE_BACKLOG_MAX:    8,
 }
 _MAIN_SECTION_NAME = "main"
 
 # application constants
 
+# matches between preserved memory codes and actual amounts of bytes
+_MEMORY_CODES_MAPPING = {
+    0: 256 * 1024 ** 2,
+    1: 512 * 1024 ** 2,
+    2: 1024 ** 3,
+    3: 2 * 1024 ** 3
+}
+
 # module global data
 _CONFIG_PARSER = ConfigParser()
 
@@ -335,6 +347,16 @@ def get_preserved_mem():
         return _DEFAULTS[_PRESERVED_MEM]
 
 
+def get_preserved_mem_bytes():
+    """
+    Retrieves the configured preserved memory amount, in bytes
+
+    :return: The configured preserved memory amount, in bytes
+    :rtype: int
+    """
+    return _MEMORY_CODES_MAPPING[get_preserved_mem()]
+
+
 def set_preserved_mem(code):
     """
     Sets preserved memory amount
@@ -345,6 +367,53 @@ def set_preserved_mem(code):
     _set(_PRESERVED_MEM, code)
 
 
+def get_decode_workers():
+    """
+    Retrieves the number of threads used to decode new image files
+
+    :return: The configured decode thread count, or its default value if config entry
+             is not parsable as an int.
+    :rtype: int
+    """
+    try:
+        return max(1, int(_get(_DECODE_WORKERS)))
+    except ValueError:
+        return _DEFAULTS[_DECODE_WORKERS]
+
+
+def set_decode_workers(count):
+    """
+    Sets the number of threads used to decode new image files
+
+    :param count: the decode thread count
+    :type count: int
+    """
+    _set(_DECODE_WORKERS, count)
+
+
+def get_decode_backlog_max():
+    """
+    Retrieves the maximum count of images being decoded or waiting for pre-processing
+
+    :return: The configured maximum, or its default value if config entry is not parsable as an int.
+    :rtype: int
+    """
+    try:
+        return max(1, int(_get(_DECODE_BACKLOG_MAX)))
+    except ValueError:
+        return _DEFAULTS[_DECODE_BACKLOG_MAX]
+
+
+def set_decode_backlog_max(count):
+    """
+    Sets the maximum count of images being decoded or waiting for pre-processing
+
+    :param count: the maximum count
+    :type count: int
+    """
+    _set(_DECODE_BACKLOG_MAX, count)
+
+
 def get_www_server_refresh_period():
     """
     Retrieves the configured web server page refresh period.
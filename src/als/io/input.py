@@ -3,29 +3,48 @@ Provides everything need to handle ALS main inputs : images.
 
 We need to read file and in the future, get images from INDI
 """
+import os
+import time
 from abc import abstractmethod
+from collections import OrderedDict, deque
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
 from logging import getLogger
 from pathlib import Path
+from threading import Event, Lock, Thread
 
 import cv2
 import exifread
+import numpy as np
+import psutil
 from PyQt5.QtCore import pyqtSignal, QObject, QT_TRANSLATE_NOOP
 from astropy.io import fits
-from rawpy import imread
+from rawpy import RawPy
 from rawpy._rawpy import LibRawNonFatalError, LibRawFatalError
 from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
 from watchdog.observers.polling import PollingObserver
 
+try:
+    import fitsio
+except ImportError:
+    fitsio = None
+
 from als import config
-from als.code_utilities import log, AlsLogAdapter
+from als.code_utilities import log, AlsLogAdapter, available_memory, human_readable_byte_size
 from als.messaging import MESSAGE_HUB
-from als.model.base import Image
+from als.model.base import Image, RunningProfile
 
 _LOGGER = AlsLogAdapter(getLogger(__name__), {})
 
-_IGNORED_FILENAME_START_PATTERNS = ['.', '~', 'tmp']
+_IGNORED_FILENAME_START_PATTERNS = ('.', '~', 'tmp')
 EXPOSURE_TIME_EXIF_TAG = 'EXIF ExposureTime'
 SCANNER_TYPE_FILESYSTEM = "FS"
+_BAYER_PATTERN_CACHE_SIZE = 32
+_NETWORK_FILESYSTEM_TYPES = ['nfs', 'nfs4', 'cifs', 'smbfs', 'smb3', 'afpfs', 'webdav', 'davfs', 'fuse.sshfs', '9p']
+
+# FITS-compatible bayer patterns, keyed by RawPy bayer pattern description. See _get_fits_bayer_pattern()
+_BAYER_PATTERN_CACHE = OrderedDict()
+_BAYER_PATTERN_CACHE_LOCK = Lock()
 
 
 class InputError(Exception):
@@ -82,10 +101,13 @@ class InputScanner:
 
     @staticmethod
     @log
-    def create_scanner(scanner_type: str = SCANNER_TYPE_FILESYSTEM):
+    def create_scanner(profile: RunningProfile, scanner_type: str = SCANNER_TYPE_FILESYSTEM):
         """
         Factory for image scanners.
 
+        :param profile: the running profile
+        :type profile: RunningProfile
+
         :param scanner_type: the type of scanner to create. Accepted values are :
 
           - "FS" for a filesystem scanner
@@ -97,23 +119,386 @@ class InputScanner:
         """
 
         if scanner_type == SCANNER_TYPE_FILESYSTEM:
-            return FolderScanner()
+            return FolderScanner(profile)
 
         raise ValueError(f"Unsupported scanner type : {scanner_type}")
 
 
+class _SettleMonitor:
+    """
+    Watches sizes of files being written and reports each file once its size is stable.
+
+    A single thread checks all watched files on each tick, so no thread is held busy waiting for
+    a specific file to be fully written.
+    """
+
+    _STABLE_TICK_COUNT = 2
+
+    @log
+    def __init__(self, on_settled):
+        """
+        Constructs a settle monitor
+
+        :param on_settled: function called with each settled file path. It must return False if file could not
+                           be taken over yet. Such a file is reported again on next tick
+        :type on_settled: callable
+        """
+        self._on_settled = on_settled
+        self._sizes = dict()
+        self._lock = Lock()
+        self._period = 0
+        self._stop_event = Event()
+        self._thread = None
+
+    @log
+    def start(self, period: float):
+        """
+        Starts watching
+
+        :param period: period between 2 checks of watched files sizes
+        :type period: float
+        """
+        self._period = period
+
+        # each thread gets its own stop event, so a thread being stopped can't be revived by a quick restart
+        self._stop_event = Event()
+        self._thread = Thread(target=self._run, args=(self._stop_event, ), name="settle-monitor", daemon=True)
+        self._thread.start()
+
+    @log
+    def stop(self):
+        """
+        Stops watching and forgets all watched files
+        """
+        self._stop_event.set()
+        self._thread = None
+        with self._lock:
+            self._sizes.clear()
+
+    @log
+    def add(self, path: str):
+        """
+        Starts watching a file
+
+        :param path: path of the file to watch
+        :type path: str
+        """
+        with self._lock:
+            self._sizes[path] = (-1, 0)
+
+    def _run(self, stop_event: Event):
+        while not stop_event.wait(self._period):
+            self._tick(stop_event)
+
+    def _tick(self, stop_event: Event):
+        settled_files = []
+
+        with self._lock:
+            for path, (last_size, stable_ticks) in list(self._sizes.items()):
+                try:
+                    size = os.stat(path).st_size
+                except OSError:
+                    # file is gone : let the reader report the problem
+                    size = last_size
+                    stable_ticks = _SettleMonitor._STABLE_TICK_COUNT
+
+                stable_ticks = stable_ticks + 1 if size == last_size else 0
+
+                if stable_ticks >= _SettleMonitor._STABLE_TICK_COUNT:
+                    del self._sizes[path]
+                    settled_files.append((path, size, stable_ticks))
+                else:
+                    self._sizes[path] = (size, stable_ticks)
+
+        # settled files are reported without holding our lock, so add() never waits on a slow take over
+        for path, size, stable_ticks in settled_files:
+            try:
+                taken_over = self._on_settled(path)
+            # pylint: disable=W0703
+            except Exception as error:
+                # a failing callback must not end this thread : file is left to its reader
+                _LOGGER.error(f"Could not hand over settled file {path}: {error}")
+                taken_over = True
+
+            if taken_over:
+                _LOGGER.debug("File %s is ready to be read", path)
+            elif not stop_event.is_set():
+                with self._lock:
+                    # file may have been added again in the meantime : its new watch wins
+                    self._sizes.setdefault(path, (size, stable_ticks))
+
+
+class DecodePool:
+    """
+    Decodes newly detected image files on a pool of worker threads.
+
+    Decoding jobs are keyed by file path, so the pre-processing pipeline can claim each decoded image
+    when it reaches the matching path in its queue. A path detected several times gets one job per detection,
+    claimed in detection order. Paths with no usable job (pool stopped, job cancelled)
+    are read synchronously by the claimer.
+
+    A file is only handed to a decoding thread once its size is stable, as reported by a settle monitor.
+
+    The number of images being decoded or waiting to be claimed is bounded. When that bound is reached, or when
+    available memory is below the user defined amount to preserve, settled files are left waiting in the settle
+    monitor. A file that is already being claimed is always decoded, so the claimer never waits on a held dispatch.
+    """
+    @log
+    def __init__(self):
+        self._executor = None
+        self._polling_period = 0
+        self._backlog_max = 0
+        self._pending_reads = dict()  # path -> deque of jobs, oldest first
+        self._in_flight = set()
+        self._claimed_paths = set()
+        self._dispatch_hold_reported = False
+        self._lock = Lock()
+        self._settle_monitor = _SettleMonitor(self._on_file_settled)
+
+    @log
+    def start(self, worker_count: int, polling_period: float, backlog_max: int):
+        """
+        Starts decoder threads
+
+        :param worker_count: how many decoding threads to run
+        :type worker_count: int
+
+        :param polling_period: period between 2 checks of a file size, while waiting for file completion
+        :type polling_period: float
+
+        :param backlog_max: maximum count of images being decoded or waiting to be claimed
+        :type backlog_max: int
+        """
+        self._polling_period = polling_period
+        self._backlog_max = backlog_max
+        self._executor = ThreadPoolExecutor(max_workers=worker_count)
+        self._settle_monitor.start(polling_period)
+
+    @log
+    def stop(self):
+        """
+        Stops decoder threads. Pending jobs are cancelled, running ones are left to complete in background
+        """
+        if self._executor is not None:
+            self._settle_monitor.stop()
+            with self._lock:
+                for futures in self._pending_reads.values():
+                    for future in futures:
+                        future.cancel()
+                self._in_flight.clear()
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    @log
+    def submit(self, path: str):
+        """
+        Schedules decoding of an image file, as soon as it is completely written
+
+        :param path: path of the file to decode
+        :type path: str
+        """
+        if self._executor is not None:
+            with self._lock:
+                self._pending_reads.setdefault(path, deque()).append(Future())
+            self._settle_monitor.add(path)
+
+    @log
+    def claim(self, path: str):
+        """
+        Retrieves decoded image for a specific path, waiting for decoding completion if needed
+
+        :param path: path of the decoded file
+        :type path: str
+
+        :return: the image read from disk or None if image is ignored or an error occurred
+        :rtype: Image or None
+        """
+        with self._lock:
+            futures = self._pending_reads.get(path, None)
+            future = futures[0] if futures else None
+            self._claimed_paths.add(path)
+
+        image = None
+        read_synchronously = future is None
+
+        try:
+            if not read_synchronously:
+                try:
+                    image = future.result()
+                except CancelledError:
+                    # pool was stopped or purged before decoding this file
+                    read_synchronously = True
+
+            if read_synchronously:
+                image = self._read_when_complete(path)
+
+        finally:
+            # a failed claim must not keep its backlog slot nor its cap bypass
+            with self._lock:
+                futures = self._pending_reads.get(path, None)
+                if future is not None and futures and futures[0] is future:
+                    futures.popleft()
+                    if not futures:
+                        del self._pending_reads[path]
+                self._in_flight.discard(future)
+                self._claimed_paths.discard(path)
+
+        return image
+
+    @log
+    def purge(self):
+        """
+        Cancels and forgets all pending jobs
+        """
+        with self._lock:
+            for futures in self._pending_reads.values():
+                for future in futures:
+                    future.cancel()
+            self._pending_reads.clear()
+            self._in_flight.clear()
+
+    def _on_file_settled(self, path: str):
+        try:
+            return self._dispatch(path)
+        # pylint: disable=W0703
+        except Exception as error:
+            _LOGGER.error(f"Could not schedule decoding of {path}: {error}. File will be read by pre-processing")
+            # cancelled jobs are read synchronously by their claimer, so nobody waits on a job never dispatched
+            with self._lock:
+                for future in self._pending_reads.get(path, ()):
+                    if future not in self._in_flight:
+                        future.cancel()
+            return True
+
+    def _dispatch(self, path: str):
+        """
+        Hands jobs of a settled file to decoding threads, as long as backlog and memory allow it
+
+        :param path: path of the settled file
+        :type path: str
+
+        :return: True if all jobs of this file got dispatched, False if some are held
+        :rtype: bool
+        """
+        with self._lock:
+            futures = self._pending_reads.get(path, ())
+
+            if self._executor is None:
+                for future in futures:
+                    future.cancel()
+                return True
+
+            undispatched = deque(future for future in futures
+                                 if not future.cancelled() and future not in self._in_flight)
+            dispatch_count = len(undispatched)
+
+            while undispatched:
+                future = undispatched[0]
+
+                # only the oldest job of a path is the one being claimed
+                claimed = future is futures[0] and path in self._claimed_paths
+                if not claimed and not self._can_dispatch():
+                    break
+
+                self._dispatch_hold_reported = False
+                self._in_flight.add(future)
+                self._executor.submit(DecodePool._decode, future, path)
+                undispatched.popleft()
+
+            dispatch_count -= len(undispatched)
+
+        if dispatch_count > 0:
+            # if all decoding threads are busy, file content is read from disk while they work
+            _advise_will_read(path)
+
+        return not undispatched
+
+    def _can_dispatch(self):
+        """
+        Tells if a new file can be handed to decoding threads, according to backlog size and available memory.
+
+        Reason of a first refusal is logged
+
+        :return: True if a new file can be decoded, False otherwise
+        :rtype: bool
+        """
+        if len(self._in_flight) >= self._backlog_max:
+            if not self._dispatch_hold_reported:
+                _LOGGER.warning(f"Decoded images backlog is full ({self._backlog_max}). Waiting for room...")
+                self._dispatch_hold_reported = True
+            return False
+
+        ram_to_preserve = config.get_preserved_mem_bytes()
+        if available_memory() < ram_to_preserve:
+            if not self._dispatch_hold_reported:
+                _LOGGER.info(f"RAM amount to preserve: {human_readable_byte_size(ram_to_preserve)} "
+                             f"/ Available: {human_readable_byte_size(available_memory())}. Waiting...")
+                self._dispatch_hold_reported = True
+            return False
+
+        return True
+
+    @staticmethod
+    def _decode(future: Future, path: str):
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(read_disk_image(Path(path)))
+            # pylint: disable=W0703
+            except Exception as error:
+                future.set_exception(error)
+
+    def _read_when_complete(self, path: str):
+        """
+        Waits for file size to stabilize, then reads image from it
+
+        :param path: path of the file to read
+        :type path: str
+
+        :return: the image read from disk or None if image is ignored or an error occurred
+        :rtype: Image or None
+        """
+        file_is_complete = False
+        last_file_size = -1
+
+        while not file_is_complete:
+            try:
+                size = os.stat(path).st_size
+            except OSError:
+                break
+
+            _LOGGER.debug("File %s's size = %d", path, size)
+
+            if size == last_file_size:
+                file_is_complete = True
+                _LOGGER.debug("File %s is ready to be read", path)
+
+            last_file_size = size
+
+            if not file_is_complete:
+                time.sleep(self._polling_period)
+
+        return read_disk_image(Path(path))
+
+
+DECODE_POOL = DecodePool()
+
+
 class FolderScanner(FileSystemEventHandler, InputScanner, QObject):
     """
     Watches file changes (creation, move) in a specific filesystem folder
 
     the watched directory is retrieved from user config on scanner startup
+
+    Each detected file is handed to the decode pool before its path is broadcast, so decoding of a burst
+    of new files runs concurrently
     """
     @log
-    def __init__(self):
+    def __init__(self, profile: RunningProfile):
         FileSystemEventHandler.__init__(self)
         InputScanner.__init__(self)
         QObject.__init__(self)
         self._observer = None
+        self._profile = profile
 
     @log
     def start(self):
@@ -121,11 +506,22 @@ class FolderScanner(FileSystemEventHandler, InputScanner, QObject):
         Starts scanning scan folder for new files
         """
         try:
+            DECODE_POOL.start(config.get_decode_workers(),
+                              self._profile.get_file_read_size_polling_period,
+                              config.get_decode_backlog_max())
             scan_folder_path = config.get_scan_folder_path()
-            self._observer = PollingObserver()
+
+            # native filesystem events are not reliably reported for network mounts
+            if _is_on_network_filesystem(scan_folder_path):
+                _LOGGER.info(f"Scan folder {scan_folder_path} is on a network filesystem. Using polling observer")
+                self._observer = PollingObserver()
+            else:
+                self._observer = Observer()
+
             self._observer.schedule(self, scan_folder_path, recursive=True)
             self._observer.start()
         except OSError as os_error:
+            DECODE_POOL.stop()
             raise ScannerStartError(os_error)
 
     @log
@@ -136,12 +532,14 @@ class FolderScanner(FileSystemEventHandler, InputScanner, QObject):
         if self._observer is not None:
             self._observer.stop()
             self._observer = None
+        DECODE_POOL.stop()
 
     @log
     def on_moved(self, event):
         if event.event_type == 'moved':
             image_path = event.dest_path
             _LOGGER.debug(f"File move detected : {image_path}")
+            DECODE_POOL.submit(image_path)
             self.broadcast_image_path(image_path)
 
     @log
@@ -149,9 +547,66 @@ class FolderScanner(FileSystemEventHandler, InputScanner, QObject):
         if event.event_type == 'created':
             image_path = event.src_path
             _LOGGER.debug(f"File creation detected : {image_path}")
+            DECODE_POOL.submit(image_path)
             self.broadcast_image_path(image_path)
 
 
+def _advise_will_read(path: str):
+    """
+    Asks the OS to start loading a file's content into page cache, without waiting for it.
+
+    Does nothing on platforms lacking posix_fadvise()
+
+    :param path: path of the file that will be read
+    :type path: str
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+
+    try:
+        file_descriptor = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(file_descriptor, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(file_descriptor)
+    except OSError as os_error:
+        _LOGGER.debug(f"Could not advise read of {path} : {os_error}")
+
+
+@log
+def _is_on_network_filesystem(path: str):
+    """
+    Tells if a path is located on a network filesystem.
+
+    We look for the mount point holding the path, and check its filesystem type and options
+
+    :param path: the path to check
+    :type path: str
+
+    :return: True if path is on a network filesystem, False otherwise or if we can't tell
+    :rtype: bool
+    """
+    real_path = os.path.realpath(path)
+    holding_partition = None
+
+    try:
+        partitions = psutil.disk_partitions(all=True)
+    except OSError:
+        return False
+
+    for partition in partitions:
+        mount_point = partition.mountpoint
+        if real_path == mount_point or real_path.startswith(mount_point.rstrip(os.sep) + os.sep):
+            if holding_partition is None or len(mount_point) > len(holding_partition.mountpoint):
+                holding_partition = partition
+
+    if holding_partition is None:
+        return False
+
+    return (holding_partition.fstype.lower() in _NETWORK_FILESYSTEM_TYPES
+            or 'remote' in holding_partition.opts.split(','))
+
+
 @log
 def read_disk_image(path: Path):
     """
@@ -164,26 +619,24 @@ def read_disk_image(path: Path):
     :rtype: Image or None
     """
 
-    ignore_image = False
     image = None
+    name = path.name
 
-    for pattern in _IGNORED_FILENAME_START_PATTERNS:
-        if path.name.startswith(pattern):
-            ignore_image = True
-            break
+    if not name.startswith(_IGNORED_FILENAME_START_PATTERNS):
 
-    if not ignore_image:
+        resolved_path = str(path.resolve())
+        extension = os.path.splitext(name)[1].lower()
 
-        if path.suffix.lower() in ['.fit', '.fits', '.fts']:
-            image = _read_fit_image(path)
+        if extension in ['.fit', '.fits', '.fts']:
+            image = _read_fit_image(resolved_path)
 
-        elif path.suffix.lower() in ['.jpg', '.jpeg', '.png', '.tif', '.tiff']:
-            image = _read_standard_image(path)
+        elif extension in ['.jpg', '.jpeg', '.png', '.tif', '.tiff']:
+            image = _read_standard_image(resolved_path)
         else:
-            image = _read_raw_image(path)
+            image = _read_raw_image(resolved_path)
 
         if image is not None:
-            image.origin = f"FILE : {str(path.resolve())}"
+            image.origin = f"FILE : {resolved_path}"
             MESSAGE_HUB.dispatch_info(
                 __name__,
                 QT_TRANSLATE_NOOP("", "Successful image read from {}"),
@@ -194,21 +647,18 @@ def read_disk_image(path: Path):
 
 
 @log
-def _read_fit_image(path: Path):
+def _read_fit_image(path: str):
     """
     read FIT image from filesystem
 
-    :param path: path to image file to load from
-    :type path: pathlib.Path
+    :param path: resolved path to image file to load from
+    :type path: str
 
     :return: the loaded image, with data and headers parsed or None if a known error occurred
     :rtype: Image or None
     """
     try:
-        with fits.open(str(path.resolve())) as fit:
-            # pylint: disable=E1101
-            data = fit[0].data
-            header = fit[0].header
+        data, header = _read_fit_primary_hdu(path)
 
         image = Image(data)
 
@@ -226,19 +676,42 @@ def _read_fit_image(path: Path):
     return image
 
 
+def _read_fit_primary_hdu(path: str):
+    """
+    Reads data and header of a FIT file's primary HDU.
+
+    fitsio is used when available, as it skips most of the per-HDU python object construction
+    done by astropy. Falls back to astropy otherwise.
+
+    :param path: path to FIT file
+    :type path: str
+
+    :return: primary HDU's data and header
+    :rtype: tuple
+    """
+    if fitsio is not None:
+        with fitsio.FITS(path) as fit:
+            return fit[0].read(), fit[0].read_header()
+
+    # data is memory-mapped, so it is only read from disk when actually accessed
+    with fits.open(path, memmap=True) as fit:
+        # pylint: disable=E1101
+        return fit[0].data, fit[0].header
+
+
 @log
-def _read_standard_image(path: Path):
+def _read_standard_image(path: str):
     """
     read standard image from filesystem using OpenCV
 
-    :param path: path to image file to load from
-    :type path: pathlib.Path
+    :param path: resolved path to image file to load from
+    :type path: str
 
     :return: the loaded image or None if a known error occurred
     :rtype: Image or None
     """
 
-    data = cv2.imread(str(path.resolve()), cv2.IMREAD_UNCHANGED)
+    data = cv2.imread(path, cv2.IMREAD_UNCHANGED)
 
     # convert color layers order for color images
     if data.ndim > 2:
@@ -248,82 +721,75 @@ def _read_standard_image(path: Path):
 
 
 @log
-def _read_raw_image(path: Path):
+def _read_raw_image(path: str):
     """
     Reads a RAW DLSR image from file
 
-    :param path: path to the file to read from
-    :type path: pathlib.Path
+    :param path: resolved path to the file to read from
+    :type path: str
 
     :return: the image or None if a known error occurred
     :rtype: Image or None
     """
 
+    raw_image = RawPy()
+
     try:
-        with imread(str(path.resolve())) as raw_image:
-
-            # in here, we make sure we store the bayer pattern as it would be advertised if image was a FITS image.
-            #
-            # lets assume image comes from a DSLR sensor with the most common bayer pattern.
-            #
-            # The actual/physical bayer pattern would look like a repetition of :
-            #
-            # +---+---+
-            # | R | G |
-            # +---+---+
-            # | G | B |
-            # +---+---+
-            #
-            # RawPy will report the bayer pattern description as 2 discrete values :
-            #
-            # 1) raw_image.raw_pattern : a 2x2 numpy array representing the indices used to express the bayer patten
-            #
-            # in our example, its value is :
-            #
-            # +---+---+
-            # | 0 | 1 |
-            # +---+---+
-            # | 3 | 2 |
-            # +---+---+
-            #
-            # and its flatten version is :
-            #
-            # [0, 1, 3, 2]
-            #
-            # 2) raw_image.color_desc : a bytes literal formed of the color of each pixel of the bayer pattern, in
-            #                           ascending index order from raw_image.raw_pattern
-            #
-            # in our example, its value is : b'RGBG'
-            #
-            # We need to express/store this pattern in a more common way, i.e. as it would be described in a FITS
-            # header. Or put simply, we want to express the bayer pattern as it would be described if
-            # raw_image.raw_pattern was :
-            #
-            # +---+---+
-            # | 0 | 1 |
-            # +---+---+
-            # | 2 | 3 |
-            # +---+---+
-            bayer_pattern_indices = raw_image.raw_pattern.flatten()
-            bayer_pattern_desc = raw_image.color_desc.decode()
-
-            _LOGGER.debug(f"Bayer pattern indices = {bayer_pattern_indices}")
-            _LOGGER.debug(f"Bayer pattern description = {bayer_pattern_desc}")
-
-            assert len(bayer_pattern_indices) == len(bayer_pattern_desc)
-            bayer_pattern = ""
-            for i, index in enumerate(bayer_pattern_indices):
-                assert bayer_pattern_indices[i] < len(bayer_pattern_indices)
-                bayer_pattern += bayer_pattern_desc[index]
-
-            _LOGGER.debug(f"Computed, FITS-compatible bayer pattern = {bayer_pattern}")
-
-            new_image = Image(raw_image.raw_image_visible.copy())
-            new_image.bayer_pattern = bayer_pattern
-
-            extract_exifs(new_image, path)
-
-            return new_image
+        raw_image.open_file(path)
+
+        # we only need raw sensor data, so we only unpack it. LibRaw's postprocessing is never triggered
+        raw_image.unpack()
+
+        # in here, we make sure we store the bayer pattern as it would be advertised if image was a FITS image.
+        #
+        # lets assume image comes from a DSLR sensor with the most common bayer pattern.
+        #
+        # The actual/physical bayer pattern would look like a repetition of :
+        #
+        # +---+---+
+        # | R | G |
+        # +---+---+
+        # | G | B |
+        # +---+---+
+        #
+        # RawPy will report the bayer pattern description as 2 discrete values :
+        #
+        # 1) raw_image.raw_pattern : a 2x2 numpy array representing the indices used to express the bayer patten
+        #
+        # in our example, its value is :
+        #
+        # +---+---+
+        # | 0 | 1 |
+        # +---+---+
+        # | 3 | 2 |
+        # +---+---+
+        #
+        # and its flatten version is :
+        #
+        # [0, 1, 3, 2]
+        #
+        # 2) raw_image.color_desc : a bytes literal formed of the color of each pixel of the bayer pattern, in
+        #                           ascending index order from raw_image.raw_pattern
+        #
+        # in our example, its value is : b'RGBG'
+        #
+        # We need to express/store this pattern in a more common way, i.e. as it would be described in a FITS
+        # header. Or put simply, we want to express the bayer pattern as it would be described if
+        # raw_image.raw_pattern was :
+        #
+        # +---+---+
+        # | 0 | 1 |
+        # +---+---+
+        # | 2 | 3 |
+        # +---+---+
+        bayer_pattern = _get_fits_bayer_pattern(raw_image.raw_pattern, raw_image.color_desc)
+
+        new_image = Image(raw_image.raw_image_visible.copy())
+        new_image.bayer_pattern = bayer_pattern
+
+        extract_exifs(new_image, path)
+
+        return new_image
 
     except LibRawNonFatalError as non_fatal_error:
         _report_fs_error(path, non_fatal_error)
@@ -331,6 +797,47 @@ def _read_raw_image(path: Path):
     except LibRawFatalError as fatal_error:
         _report_fs_error(path, fatal_error)
         return None
+    finally:
+        raw_image.close()
+
+
+def _get_fits_bayer_pattern(raw_pattern, color_desc: bytes):
+    """
+    Gets the FITS-compatible bayer pattern matching a RawPy bayer pattern description.
+
+    Results are cached, as all images of a session usually come from the same camera
+
+    :param raw_pattern: RawPy bayer pattern indices
+    :type raw_pattern: numpy.ndarray
+
+    :param color_desc: RawPy bayer pattern colors description
+    :type color_desc: bytes
+
+    :return: the FITS-compatible bayer pattern
+    :rtype: str
+    """
+    key = (raw_pattern.tobytes(), color_desc)
+
+    with _BAYER_PATTERN_CACHE_LOCK:
+        if key in _BAYER_PATTERN_CACHE:
+            _BAYER_PATTERN_CACHE.move_to_end(key)
+            return _BAYER_PATTERN_CACHE[key]
+
+    bayer_pattern_indices = raw_pattern.flatten()
+
+    _LOGGER.debug(f"Bayer pattern indices = {bayer_pattern_indices}")
+    _LOGGER.debug(f"Bayer pattern description = {color_desc.decode()}")
+
+    bayer_pattern = np.frombuffer(color_desc, dtype='S1')[bayer_pattern_indices].tobytes().decode()
+
+    _LOGGER.debug(f"Computed, FITS-compatible bayer pattern = {bayer_pattern}")
+
+    with _BAYER_PATTERN_CACHE_LOCK:
+        _BAYER_PATTERN_CACHE[key] = bayer_pattern
+        if len(_BAYER_PATTERN_CACHE) > _BAYER_PATTERN_CACHE_SIZE:
+            _BAYER_PATTERN_CACHE.popitem(last=False)
+
+    return bayer_pattern
 
 
 @log
@@ -345,7 +852,7 @@ def extract_exifs(image, image_path):
     :type image: Image
 
     :param image_path: path to original file
-    :type image_path: Path
+    :type image_path: str
 
     :return: None
     """
@@ -358,8 +865,8 @@ def extract_exifs(image, image_path):
 
 
 @log
-def _report_fs_error(path: Path, error: Exception):
+def _report_fs_error(path: str, error: Exception):
     MESSAGE_HUB.dispatch_error(
         __name__,
         QT_TRANSLATE_NOOP("", "Error reading from file {} : {}"),
-        [str(path.resolve()), str(error)])
+        [path, str(error)])
@@ -29,7 +29,7 @@ from PyQt5.QtCore import QFile, QT_TRANSLATE_NOOP, QCoreApplication, QThread, QT
 from als import config
 from als.code_utilities import log, AlsException, SignalingQueue, get_text_content_of_resource, get_timestamp, \
     available_memory, AlsLogAdapter
-from als.io.input import InputScanner, ScannerStartError
+from als.io.input import InputScanner, ScannerStartError, DECODE_POOL
 from als.io.network import get_ip, WebServer
 from als.io.output import ImageSaver
 from als.messaging import MESSAGE_HUB
@@ -94,17 +94,17 @@ class Controller:
 
         DYNAMIC_DATA.last_timing = 0
 
-        self._input_scanner: InputScanner = InputScanner.create_scanner()
-
         profile_code = config.get_profile()
         self._profile = Controller.profiles[profile_code]
         _LOGGER.debug(f"*SD-PROFILE* Using running profile: {profile_code}")
 
+        self._input_scanner: InputScanner = InputScanner.create_scanner(self._profile)
+
         self._pre_process_queue: SignalingQueue = DYNAMIC_DATA.pre_process_queue
         self._pre_process_pipeline: Pipeline = Pipeline(
             'pre-process',
             self._pre_process_queue,
-            [FileReader(self._profile), RemoveDark(), HotPixelRemover(), Debayer(), Standardize()])
+            [FileReader(), RemoveDark(), HotPixelRemover(), Debayer(), Standardize()])
         self._pre_process_pipeline.start(self._profile.get_pre_process_priority)
 
         self._stacker_queue: SignalingQueue = DYNAMIC_DATA.stacker_queue
@@ -194,7 +194,6 @@ class Controller:
         """
         return self._levels_processor.get_parameters()
 
-    @log
     def remove_model_observer(self, observer):
         """
         Removes observer from our observers list.
@@ -205,7 +204,6 @@ class Controller:
         if observer in self._model_observers:
             self._model_observers.remove(observer)
 
-    @log
     def _notify_model_observers(self, image_only=False):
         """
         Tells all registered observers to update their display
@@ -213,7 +211,6 @@ class Controller:
         for observer in self._model_observers:
             observer.update_display(image_only)
 
-    @log
     def add_model_observer(self, observer):
         """
         Adds an observer to our observers list.
@@ -235,7 +232,6 @@ class Controller:
             image_to_process.ticket = "ALZ"
             DYNAMIC_DATA.process_queue.put(image_to_process)
 
-    @log
     def get_save_every_image(self) -> bool:
         """
         Retrieves the flag that tells if we need to save every process result image
@@ -255,7 +251,6 @@ class Controller:
         """
         self._save_every_image = save_every_image
 
-    @log
     def get_align_before_stack(self) -> bool:
         """
         Gets "align before stack" switch
@@ -275,7 +270,6 @@ class Controller:
         """
         self._stacker.align_before_stack = align
 
-    @log
     def get_stacking_mode(self):
         """
         Gets current stacking mode
@@ -374,7 +368,7 @@ class Controller:
         :param new_size: new queue size
         :type new_size: int
         """
-        _LOGGER.debug(f"*SD-Q-PRE* New pre-processor queue size: {new_size}")
+        _LOGGER.debug("*SD-Q-PRE* New pre-processor queue size: %d", new_size)
         self._notify_model_observers()
 
     @log
@@ -385,7 +379,7 @@ class Controller:
         :param new_size: new queue size
         :type new_size: int
         """
-        _LOGGER.debug(f"*SD-Q-STA* New stacker queue size : {new_size}")
+        _LOGGER.debug("*SD-Q-STA* New stacker queue size : %d", new_size)
         self._notify_model_observers()
 
     @log
@@ -396,7 +390,7 @@ class Controller:
         :param new_size: new queue size
         :type new_size: int
         """
-        _LOGGER.debug(f"*SD-Q-POST* New post-processor queue size: {new_size}")
+        _LOGGER.debug("*SD-Q-POST* New post-processor queue size: %d", new_size)
         self._notify_model_observers()
 
     @log
@@ -407,7 +401,7 @@ class Controller:
         :param new_size: new queue size
         :type new_size: int
         """
-        _LOGGER.debug(f"*SD-Q-SAV* New saver queue size : {new_size}")
+        _LOGGER.debug("*SD-Q-SAV* New saver queue size : %d", new_size)
         self._notify_model_observers()
 
     @log
@@ -544,6 +538,7 @@ class Controller:
             DYNAMIC_DATA.session.set_status(Session.stopped)
             self._stop_input_scanner()
             Controller.purge_queue(self._pre_process_queue)
+            DECODE_POOL.purge()
             Controller.purge_queue(self._stacker_queue)
             Controller.purge_queue(self._post_process_queue)
             MESSAGE_HUB.dispatch_info(__name__, QT_TRANSLATE_NOOP("", "Session stopped"))
@@ -613,8 +608,7 @@ class Controller:
         :type queue: SignalingQueue
         """
 
-        while not queue.empty():
-            queue.get()
+        queue.clear()
 
     @staticmethod
     @log
@@ -98,6 +98,7 @@ class Image:
         :type data: numpy.ndarray
         """
         self._data = data
+        self._refresh_shape()
         self._bayer_pattern: str = ""
         self._origin: str = "UNDEFINED"
         self._destination: str = "UNDEFINED"
@@ -185,6 +186,27 @@ class Image:
     @data.setter
     def data(self, data):
         self._data = data
+        self._refresh_shape()
+
+    # pylint: disable=W0201
+    def _refresh_shape(self):
+        """
+        Computes and caches all shape-derived image info. Must be called each time data array is replaced
+        """
+        self._ndim = self._data.ndim
+
+        if self._ndim == 2:
+            self._dimensions = self._data.shape
+            self._color_axis = None
+        else:
+            # color axis 0-based index is the index of the smallest data.shape item
+            dimensions = list(self._data.shape)
+            self._color_axis = dimensions.index(min(dimensions))
+            del dimensions[self._color_axis]
+            self._dimensions = tuple(dimensions)
+
+        self._width = max(self._dimensions)
+        self._height = min(self._dimensions)
 
     @property
     def origin(self):
@@ -222,12 +244,7 @@ class Image:
         :return: the image dimensions
         :rtype: tuple
         """
-        if self._data.ndim == 2:
-            return self._data.shape
-
-        dimensions = list(self.data.shape)
-        dimensions.remove(min(dimensions))
-        return dimensions
+        return self._dimensions
 
     @property
     def width(self):
@@ -237,7 +254,7 @@ class Image:
         :return: image width in pixels
         :rtype: int
         """
-        return max(self.dimensions)
+        return self._width
 
     @property
     def height(self):
@@ -247,7 +264,7 @@ class Image:
         :return: image height in pixels
         :rtype: int
         """
-        return min(self.dimensions)
+        return self._height
 
     @bayer_pattern.setter
     def bayer_pattern(self, bayer_pattern):
@@ -259,7 +276,7 @@ class Image:
 
         :return: True if a bayer pattern is known and data does not have 3 dimensions
         """
-        return self._bayer_pattern != "" and self.data.ndim < 3
+        return self._bayer_pattern != "" and self._ndim < 3
 
     def is_color(self):
         """
@@ -270,9 +287,8 @@ class Image:
         :return: True if the image has color information, False otherwise
         :rtype: bool
         """
-        return self._data.ndim > 2
+        return self._ndim > 2
 
-    @log
     def is_bw(self):
         """
         Tells if image is black and white
@@ -280,9 +296,8 @@ class Image:
         :return: True if no color info is stored in data array, False otherwise
         :rtype: bool
         """
-        return self._data.ndim == 2 and self._bayer_pattern == ""
+        return self._ndim == 2 and self._bayer_pattern == ""
 
-    @log
     def is_same_shape_as(self, other):
         """
         Is this image's shape equal to another's ?
@@ -305,15 +320,8 @@ class Image:
         Image data is modified in place
         """
 
-        if self._data.ndim > 2:
-
-            # find what axis are the colors on.
-            # axis 0-based index is the index of the smallest data.shape item
-            shape = self._data.shape
-            color_axis = shape.index(min(shape))
-
-            if color_axis != wanted_axis:
-                self._data = np.moveaxis(self._data, color_axis, wanted_axis)
+        if self._color_axis is not None and self._color_axis != wanted_axis:
+            self.data = np.moveaxis(self._data, self._color_axis, wanted_axis)
 
     def __repr__(self):
         representation = (f'{self.__class__.__name__}('
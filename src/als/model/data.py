@@ -137,7 +137,6 @@ class HistogramContainer:
         self._histograms: List[np.ndarray] = list()
         self._global_maximum: int = 0
 
-    @log
     def add_histogram(self, histogram: np.ndarray):
         """
         Add an histogram
@@ -148,7 +147,6 @@ class HistogramContainer:
         """
         self._histograms.append(histogram)
 
-    @log
     def get_histograms(self) -> List[np.ndarray]:
         """
         Gets the histograms
@@ -159,7 +157,6 @@ class HistogramContainer:
         return self._histograms
 
     @property
-    @log
     def global_maximum(self) -> int:
         """
         Gets the global maximum among all histograms
@@ -170,7 +167,6 @@ class HistogramContainer:
         return self._global_maximum
 
     @global_maximum.setter
-    @log
     def global_maximum(self, value: int):
         """
         Sets the global maximum among all histograms
@@ -181,7 +177,6 @@ class HistogramContainer:
         self._global_maximum = value
 
     @property
-    @log
     def bin_count(self):
         """
         Get the bin count, that is the length of any stored histogram. We check the first one if exists
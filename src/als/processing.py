@@ -3,13 +3,13 @@ Provides all means of image processing
 """
 import time
 from abc import abstractmethod
-from logging import getLogger
+from logging import getLogger, DEBUG
 from pathlib import Path
 from typing import List
 
 import cv2
 import numpy as np
-from PyQt5.QtCore import QThread, pyqtSignal, QT_TRANSLATE_NOOP, QFileInfo
+from PyQt5.QtCore import QThread, pyqtSignal, QT_TRANSLATE_NOOP
 from PyQt5.QtGui import QPixmap
 from qimage2ndarray import array2qimage
 from scipy.signal import convolve2d
@@ -18,9 +18,8 @@ from als import config
 from als.code_utilities import log, Timer, SignalingQueue, human_readable_byte_size, available_memory, AlsLogAdapter
 from als.crunching import compute_histograms_for_display
 from als.io import input as als_input
-from als.io.input import read_disk_image
 from als.messaging import MESSAGE_HUB
-from als.model.base import Image, RunningProfile
+from als.model.base import Image
 from als.model.data import I18n, DYNAMIC_DATA
 from als.model.params import ProcessingParameter, RangeParameter, SwitchParameter
 from contrib.stretch import Stretch
@@ -312,6 +311,8 @@ class Standardize(ImageProcessor):
 
       #. each array element is of type float32
 
+      #. data array is C-contiguous, so each color plane is a single block of memory
+
     """
     @log
     def process_image(self, image: Image):
@@ -322,7 +323,7 @@ class Standardize(ImageProcessor):
         if image.is_color():
             image.set_color_axis_as(0)
 
-        image.data = np.float32(image.data)
+        image.data = np.ascontiguousarray(image.data, dtype=np.float32)
 
         return image
 
@@ -332,52 +333,26 @@ class FileReader(ImageProcessor):
     Handles image read from file
     """
 
-    def __init__(self, profile: RunningProfile):
-        super().__init__()
-        self._profile = profile
-
-    MEMORY_CODES_MAPPING = {
-
-        0: 256 * 1024 ** 2,
-        1: 512 * 1024 ** 2,
-        2: 1024 ** 3,
-        3: 2 * 1024 ** 3
-    }
-
     # //FIXME : BEWARE, in this specific processor, what we actually process is file paths, not image objects
     def process_image(self, image: Image):
         image_path = image
 
         # TODO: Move this logic to Controller somehow
-        ram_to_preserve = FileReader.MEMORY_CODES_MAPPING[config.get_preserved_mem()]
+        ram_to_preserve = config.get_preserved_mem_bytes()
 
-        _LOGGER.debug(f"RAM amount to preserve: {human_readable_byte_size(ram_to_preserve)}")
-        _LOGGER.debug(f" Available system memory : {human_readable_byte_size(available_memory())}")
+        # available memory is queried from the OS : only do it if we actually log it
+        if _LOGGER.isEnabledFor(DEBUG):
+            _LOGGER.debug("RAM amount to preserve: %s", human_readable_byte_size(ram_to_preserve))
+            _LOGGER.debug(" Available system memory : %s", human_readable_byte_size(available_memory()))
 
         while available_memory() < ram_to_preserve:
             _LOGGER.info(f"RAM amount to preserve: {human_readable_byte_size(ram_to_preserve)} "
                          f"/ Available: {human_readable_byte_size(available_memory())}. Waiting...")
             time.sleep(.2)
 
-        _LOGGER.debug('RAM amount is OK. Reading new file...')
-
-        file_is_complete = False
-        last_file_size = -1
-
-        while not file_is_complete:
-            size = QFileInfo(image_path).size()
-            _LOGGER.debug(f"File {image_path}'s size = {size}")
-
-            if size == last_file_size:
-                file_is_complete = True
-                _LOGGER.debug(f"File {image_path} is ready to be read")
-
-            last_file_size = size
-
-            if not file_is_complete:
-                time.sleep(self._profile.get_file_read_size_polling_period)
+        _LOGGER.debug('RAM amount is OK. Claiming decoded file...')
 
-        image = read_disk_image(Path(image_path))
+        image = als_input.DECODE_POOL.claim(image_path)
         if image:
             image.ticket = image_path
         return image
@@ -0,0 +1,251 @@
+"""
+Tests for the image files decoding pool and its settle monitor
+"""
+import threading
+import time
+
+import pytest
+
+from als.io import input as als_input
+from als.io.input import DecodePool, _SettleMonitor
+
+_TIMEOUT = 5
+
+
+@pytest.fixture
+def fake_reads(monkeypatch):
+    """
+    Replaces actual image decoding by a fake one, returning the path of the decoded file
+    """
+    monkeypatch.setattr(als_input, 'read_disk_image', str)
+    monkeypatch.setattr(als_input, 'available_memory', lambda: 2 ** 62)
+
+
+def _wait_for(condition):
+    deadline = time.time() + _TIMEOUT
+    while not condition():
+        assert time.time() < deadline, "condition not met in time"
+        time.sleep(.01)
+
+
+def _claim_in_thread(pool, path):
+    results = []
+    thread = threading.Thread(target=lambda: results.append(pool.claim(path)), daemon=True)
+    thread.start()
+    return thread, results
+
+
+def _create_file(folder, name):
+    path = folder / name
+    path.write_bytes(b'data')
+    return str(path)
+
+
+@pytest.mark.parametrize("interruption", ["stop", "purge"])
+def test_claim_survives_pool_interruption(tmp_path, monkeypatch, fake_reads, interruption):
+
+    # files never settle, so the claimer is left waiting on a job that will be cancelled
+    monkeypatch.setattr(_SettleMonitor, '_STABLE_TICK_COUNT', 10 ** 6)
+    path = _create_file(tmp_path, "image.fits")
+
+    pool = DecodePool()
+    pool.start(1, .01, 8)
+    pool.submit(path)
+
+    thread, results = _claim_in_thread(pool, path)
+    _wait_for(lambda: path in pool._claimed_paths)
+
+    getattr(pool, interruption)()
+    thread.join(_TIMEOUT)
+    pool.stop()
+
+    assert not thread.is_alive()
+    assert results == [path]
+
+
+def test_claim_of_unknown_path_reads_synchronously(tmp_path, fake_reads):
+
+    path = _create_file(tmp_path, "image.fits")
+
+    pool = DecodePool()
+    pool.start(1, .01, 8)
+
+    assert pool.claim(path) == path
+    assert not pool._pending_reads
+    assert not pool._claimed_paths
+
+    pool.stop()
+
+
+def test_claimed_file_bypasses_full_backlog(tmp_path, fake_reads):
+
+    first_path = _create_file(tmp_path, "first.fits")
+    second_path = _create_file(tmp_path, "second.fits")
+
+    pool = DecodePool()
+    pool.start(2, .01, 1)
+
+    pool.submit(first_path)
+    _wait_for(lambda: len(pool._in_flight) == 1)
+
+    # second file settles, but backlog is full
+    pool.submit(second_path)
+    time.sleep(.1)
+    assert len(pool._in_flight) == 1
+
+    thread, results = _claim_in_thread(pool, second_path)
+    thread.join(_TIMEOUT)
+
+    assert not thread.is_alive()
+    assert results == [second_path]
+    assert pool.claim(first_path) == first_path
+
+    pool.stop()
+
+
+def test_duplicate_submissions_are_claimed_in_order(tmp_path, monkeypatch, fake_reads):
+
+    decodes = []
+
+    def counting_read(path):
+        decodes.append(path)
+        return len(decodes)
+
+    monkeypatch.setattr(als_input, 'read_disk_image', counting_read)
+    path = _create_file(tmp_path, "image.fits")
+
+    pool = DecodePool()
+    pool.start(1, .01, 8)
+
+    # same file detected twice before its first job got dispatched
+    pool.submit(path)
+    pool.submit(path)
+    _wait_for(lambda: len(decodes) == 2)
+
+    # file overwritten after previous jobs got decoded
+    pool.submit(path)
+    _wait_for(lambda: len(decodes) == 3)
+
+    assert [pool.claim(path) for _ in range(3)] == [1, 2, 3]
+    assert not pool._in_flight
+    assert not pool._pending_reads
+
+    pool.stop()
+
+
+def test_failed_claim_releases_backlog_slot(tmp_path, monkeypatch, fake_reads):
+
+    def failing_read(path):
+        raise OSError(path)
+
+    monkeypatch.setattr(als_input, 'read_disk_image', failing_read)
+    path = _create_file(tmp_path, "image.fits")
+
+    pool = DecodePool()
+    pool.start(1, .01, 8)
+    pool.submit(path)
+
+    with pytest.raises(OSError):
+        pool.claim(path)
+
+    assert not pool._in_flight
+    assert not pool._claimed_paths
+    assert not pool._pending_reads
+
+    pool.stop()
+
+
+def test_claim_survives_dispatch_failure(tmp_path, monkeypatch, fake_reads):
+
+    def failing_memory_check():
+        raise KeyError("preserved_mem")
+
+    monkeypatch.setattr(als_input, 'available_memory', failing_memory_check)
+    first_path = _create_file(tmp_path, "first.fits")
+    second_path = _create_file(tmp_path, "second.fits")
+
+    pool = DecodePool()
+    pool.start(1, .01, 8)
+    pool.submit(first_path)
+    pool.submit(second_path)
+
+    # first file is claimed before it settles, second one after
+    first_thread, first_results = _claim_in_thread(pool, first_path)
+    first_thread.join(_TIMEOUT)
+    second_thread, second_results = _claim_in_thread(pool, second_path)
+    second_thread.join(_TIMEOUT)
+    pool.stop()
+
+    assert not first_thread.is_alive() and not second_thread.is_alive()
+    assert first_results == [first_path]
+    assert second_results == [second_path]
+
+
+def test_settle_monitor_survives_callback_failure(tmp_path):
+
+    first_path = _create_file(tmp_path, "first.fits")
+    second_path = _create_file(tmp_path, "second.fits")
+    calls = []
+
+    def failing_callback(settled_path):
+        calls.append(settled_path)
+        raise RuntimeError(settled_path)
+
+    monitor = _SettleMonitor(failing_callback)
+    monitor.start(.01)
+    monitor.add(first_path)
+    _wait_for(lambda: calls)
+    monitor.add(second_path)
+    _wait_for(lambda: len(calls) == 2)
+    monitor.stop()
+
+    assert calls == [first_path, second_path]
+
+
+def test_settle_monitor_restart_runs_single_thread(tmp_path):
+
+    path = _create_file(tmp_path, "image.fits")
+    calls = []
+
+    def slow_refusal(settled_path):
+        calls.append(settled_path)
+        time.sleep(.05)
+        return False
+
+    def count_monitor_threads():
+        return len([thread for thread in threading.enumerate() if thread.name == "settle-monitor"])
+
+    initial_thread_count = count_monitor_threads()
+
+    # restart while monitor thread is in the middle of a tick
+    monitor = _SettleMonitor(slow_refusal)
+    monitor.start(.01)
+    monitor.add(path)
+    _wait_for(lambda: calls)
+    monitor.stop()
+    monitor.start(.01)
+
+    time.sleep(.2)
+    thread_count = count_monitor_threads() - initial_thread_count
+    monitor.stop()
+
+    assert thread_count == 1
+
+
+def test_settle_monitor_retries_refused_files(tmp_path):
+
+    path = _create_file(tmp_path, "image.fits")
+    calls = []
+
+    def on_settled(settled_path):
+        calls.append(settled_path)
+        return len(calls) >= 3
+
+    monitor = _SettleMonitor(on_settled)
+    monitor.start(.01)
+    monitor.add(path)
+    _wait_for(lambda: len(calls) >= 3)
+    time.sleep(.1)
+    monitor.stop()
+
+    assert calls == [path] * 3